@@ -4,90 +4,136 @@ Resume Export Script
 Prompts user for directory name and exports the compiled resume to the specified location.
 """
 
+import errno
+import functools
 import os
+import re
 import sys
-import shutil
-import subprocess
-from datetime import datetime
 from pathlib import Path
 
-# ANSI color codes for terminal output
-class Colors:
-    HEADER = '\033[95m'      # Purple
-    OKBLUE = '\033[94m'      # Blue
-    OKCYAN = '\033[96m'      # Cyan
-    OKGREEN = '\033[92m'     # Green
-    WARNING = '\033[93m'     # Yellow
-    FAIL = '\033[91m'        # Red
-    ENDC = '\033[0m'         # Reset
-    BOLD = '\033[1m'         # Bold
-    UNDERLINE = '\033[4m'    # Underline
-
-def colorize(text, color):
-    """Apply color to text."""
-    return f"{color}{text}{Colors.ENDC}"
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Pre-encoded ANSI color prefixes for terminal output
+_HEADER = b'\033[95m'                          # Purple
+_PROMPT = b'\033[94m'                          # Blue
+_INFO = b'\033[96m'                            # Cyan
+_SUCCESS = '\033[92m✓ '.encode('utf-8')        # Green
+_WARNING = '\033[93m⚠ '.encode('utf-8')        # Yellow
+_ERROR = '\033[91m✗ '.encode('utf-8')          # Red
+_END = b'\033[0m\n'                           # Reset + newline
+
+def _write(prefix, text, flush=False):
+    """Write a colored line straight to the stdout byte stream."""
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        sys.stdout.write((prefix + text.encode('utf-8') + _END).decode('utf-8'))
+        return
+    out.write(prefix)
+    out.write(text.encode('utf-8'))
+    out.write(_END)
+    if flush:
+        out.flush()
 
 def print_header(text):
     """Print header text in purple."""
-    print(colorize(f"\n{text}", Colors.HEADER))
-    print(colorize("=" * len(text), Colors.HEADER))
+    _write(_HEADER, f"\n{text}")
+    _write(_HEADER, "=" * len(text))
 
 def print_success(text):
     """Print success text in green."""
-    print(colorize(f"✓ {text}", Colors.OKGREEN))
+    _write(_SUCCESS, text)
 
 def print_error(text):
     """Print error text in red."""
-    print(colorize(f"✗ {text}", Colors.FAIL))
+    _write(_ERROR, text)
 
 def print_warning(text):
     """Print warning text in yellow."""
-    print(colorize(f"⚠ {text}", Colors.WARNING))
+    _write(_WARNING, text)
 
 def print_info(text):
     """Print info text in cyan."""
-    print(colorize(f"{text}", Colors.OKCYAN))
+    _write(_INFO, text)
 
 def print_prompt(text):
     """Print prompt text in blue."""
-    print(colorize(text, Colors.OKBLUE))
+    _write(_PROMPT, text, flush=True)
+
+
+_RESUME_SRC = Path("resume.pdf")
+
+_REQUIRED_ENV = ('BASE_DIR', 'FIRST_NAME', 'LAST_NAME')
+# [^\S\n] is whitespace other than newline, so a match never spans lines
+_ENV_LINE = re.compile(r'^[^\S\n]*([A-Za-z_][A-Za-z0-9_]*)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.M)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(path, mtime_ns, size):
+    """Parse a .env file, reusing the on-disk cache while the file is unchanged."""
+    import json
+
+    cache_key = [path, mtime_ns, size]
+    try:
+        cache_file = Path.home() / '.cache' / 'resume_export.json'
+    except RuntimeError:  # home directory cannot be determined
+        cache_file = None
+
+    if cache_file is not None:
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                cached = json.load(f)
+            if (isinstance(cached, dict) and cached.get('key') == cache_key
+                    and isinstance(cached.get('config'), dict)):
+                return cached['config']
+        except (OSError, ValueError):
+            pass
+
+    text = Path(path).read_text()
+    # Remove quotes if present
+    config = {key: value.strip('"\'') for key, value in _ENV_LINE.findall(text)}
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'config': config}, f)
+        except OSError:
+            pass
+
+    return config
+
+
+def _prefetch_environment():
+    """Warm the .env parse cache; any errors are reported by load_environment."""
+    try:
+        st = os.stat('.env')
+        _parse_env_file(str(Path('.env').resolve()), st.st_mtime_ns, st.st_size)
+    except Exception:
+        pass
 
 
 def load_environment():
     """Load environment variables from .env file."""
     env_file = Path('.env')
     
-    if not env_file.exists():
+    try:
+        st = os.stat('.env')
+    except FileNotFoundError:
         print_error(".env file not found!")
         print_info("Please copy .env.example to .env and set a valid BASE_DIR path.")
         sys.exit(1)
     
-    config = {}
     try:
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    # Remove quotes if present
-                    value = value.strip().strip('"\'')
-                    config[key] = value
+        config = dict(_parse_env_file(str(env_file.resolve()), st.st_mtime_ns, st.st_size))
         
         # Check required variables
-        if 'BASE_DIR' not in config or not config['BASE_DIR']:
-            print_error("BASE_DIR not found or empty in .env file!")
-            print_info("Please set a valid BASE_DIR path in your .env file.")
-            sys.exit(1)
-            
-        if 'FIRST_NAME' not in config or not config['FIRST_NAME']:
-            print_error("FIRST_NAME not found or empty in .env file!")
-            print_info("Please set your first name in your .env file.")
-            sys.exit(1)
-            
-        if 'LAST_NAME' not in config or not config['LAST_NAME']:
-            print_error("LAST_NAME not found or empty in .env file!")
-            print_info("Please set your last name in your .env file.")
+        missing = [key for key in _REQUIRED_ENV if not config.get(key)]
+        if missing:
+            print_error(f"Missing or empty in .env file: {', '.join(missing)}")
+            print_info("Please set BASE_DIR, FIRST_NAME, and LAST_NAME in your .env file.")
             sys.exit(1)
         
         return Path(config['BASE_DIR']), config['FIRST_NAME'], config['LAST_NAME']
@@ -98,38 +144,86 @@ def load_environment():
         sys.exit(1)
 
 
+def _git_env():
+    """Minimal environment for git: no system config, no locks, C locale."""
+    env = {
+        'PATH': os.environ.get('PATH', os.defpath),
+        'GIT_CONFIG_NOSYSTEM': '1',
+        'GIT_OPTIONAL_LOCKS': '0',
+        'LC_ALL': 'C',
+    }
+    # Windows processes fail to start without SYSTEMROOT
+    if 'SYSTEMROOT' in os.environ:
+        env['SYSTEMROOT'] = os.environ['SYSTEMROOT']
+    return env
+
+
+@functools.lru_cache(maxsize=1)
 def get_git_branch():
     """Get the current git branch name."""
+    # Read .git/HEAD directly for the common attached-branch case to avoid
+    # spawning git; fall back to git for detached heads and worktrees.
+    try:
+        with open('.git/HEAD') as f:
+            head = f.read().strip()
+        if head.startswith('ref: refs/heads/'):
+            return head[len('ref: refs/heads/'):]
+    except OSError:
+        pass
+
+    import subprocess
     try:
         result = subprocess.run(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], 
-                              capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
+                              capture_output=True, check=True,
+                              env=_git_env(), timeout=2)
+        # Decode as UTF-8 directly; skips the locale-aware text decoding
+        return result.stdout.rstrip(b'\r\n').decode('utf-8', 'replace')
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
         return "unknown"
 
 
-def get_default_directory_name():
+def get_default_directory_name(branch=None):
     """Generate default directory name: <branch> <mm-dd-yy>."""
-    branch = get_git_branch()
-    date_str = datetime.now().strftime("%m-%d-%y")
+    if branch is None:
+        branch = get_git_branch()
+    from datetime import date
+    today = date.today()
+    date_str = f"{today.month:02d}-{today.day:02d}-{today.year % 100:02d}"
     return f"{branch} {date_str}"
 
 
-def check_resume_exists():
-    """Check if the compiled resume (resume.pdf) exists."""
-    resume_path = Path("resume.pdf")
-    if not resume_path.exists():
+def open_resume():
+    """Open the compiled resume (resume.pdf) for reading.
+
+    Returns a read-only fd that the caller must close, or None if the
+    resume is missing or cannot be opened.
+    """
+    try:
+        return os.open(_RESUME_SRC, os.O_RDONLY)
+    except FileNotFoundError:
         print_error("Compiled resume (resume.pdf) not found!")
         print_info("Please compile your resume first.")
-        return False
-    return True
+    except OSError as e:
+        print_error(f"Error opening resume: {e}")
+    return None
 
 
 def create_directory(base_path, dir_name):
     """Create the target directory."""
     target_path = base_path / dir_name
     try:
-        target_path.mkdir(parents=True, exist_ok=True)
+        # The base directory must already exist; only intermediate
+        # subdirectories of dir_name are created on demand.
+        try:
+            target_path.mkdir(exist_ok=True)
+        except FileNotFoundError:
+            try:
+                os.stat(base_path)
+            except FileNotFoundError:
+                print_error(f"Base directory does not exist: {base_path}")
+                print_info("Please check the BASE_DIR path in your .env file and ensure it exists.")
+                return None
+            target_path.mkdir(parents=True, exist_ok=True)
         print_success(f"Created directory: {target_path}")
         return target_path
     except Exception as e:
@@ -137,27 +231,194 @@ def create_directory(base_path, dir_name):
         return None
 
 
-def copy_resume(target_dir, first_name, last_name):
+_COPY_BUFSIZE = 1 << 20  # 1 MiB
+FICLONE = 0x40049409      # Linux ioctl: share extents with another file (reflink)
+
+
+def _fast_copy(src, dst, src_fd=None):
+    """Copy src to dst in-kernel where possible, then copy metadata.
+
+    Tries a FICLONE reflink (O(1) on btrfs/XFS), then os.copy_file_range
+    (lets CoW filesystems clone extents), then os.sendfile, then a plain
+    readinto loop with a 1 MiB buffer. If src_fd is given it is read from
+    instead of reopening src, and is left open.
+    """
+    owns_src_fd = src_fd is None
+    if owns_src_fd:
+        src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            size = os.fstat(src_fd).st_size
+            offset = 0
+
+            if fcntl is not None and sys.platform.startswith('linux'):
+                try:
+                    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                    offset = size
+                except OSError as e:
+                    if e.errno not in (errno.ENOTTY, errno.EXDEV, errno.EOPNOTSUPP,
+                                       errno.EINVAL, errno.EBADF, errno.EPERM):
+                        raise
+
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while offset < size:
+                        sent = os.copy_file_range(src_fd, dst_fd, size - offset,
+                                                  offset_src=offset, offset_dst=offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                       errno.EOPNOTSUPP, errno.EPERM):
+                        raise
+
+            if offset < size and hasattr(os, 'sendfile'):
+                try:
+                    while offset < size:
+                        os.lseek(dst_fd, offset, os.SEEK_SET)
+                        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError as e:
+                    if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK,
+                                       errno.EOPNOTSUPP):
+                        raise
+
+            if offset < size:
+                os.lseek(src_fd, offset, os.SEEK_SET)
+                os.lseek(dst_fd, offset, os.SEEK_SET)
+                buf = memoryview(bytearray(_COPY_BUFSIZE))
+                with open(src_fd, 'rb', buffering=0, closefd=False) as f:
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        view = buf[:n]
+                        while view:
+                            view = view[os.write(dst_fd, view):]
+        finally:
+            os.close(dst_fd)
+    finally:
+        if owns_src_fd:
+            os.close(src_fd)
+
+    import shutil
+    shutil.copystat(src, dst)
+
+
+_WSL_DRIVE_PATH = re.compile(r'^/mnt/[a-zA-Z]/')
+
+
+def _is_wsl():
+    """Return True when running under Windows Subsystem for Linux."""
+    return 'WSL_DISTRO_NAME' in os.environ or 'microsoft' in os.uname().release.lower()
+
+
+def _windows_copy(src, dst):
+    """Copy using the native CopyFile2 API on Windows."""
+    import ctypes
+    copy_file2 = ctypes.windll.kernel32.CopyFile2
+    copy_file2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+    copy_file2.restype = ctypes.HRESULT  # raises OSError on failure
+    copy_file2(str(src), str(dst), None)
+
+
+# Characters cmd.exe treats as operators, escapes or variable references
+_CMD_SPECIAL_CHARS = frozenset('&|^%<>!"')
+
+
+def _wsl_to_windows_path(path):
+    """Translate a WSL path to its Windows form via wslpath.
+
+    Only the (existing) parent directory is converted, since some wslpath
+    releases reject paths that do not exist yet.
+    """
+    import subprocess
+    path = Path(path).resolve()
+    result = subprocess.run(['wslpath', '-w', str(path.parent)],
+                            capture_output=True, text=True, check=True)
+    return f"{result.stdout.strip()}\\{path.name}"
+
+
+def _wsl_windows_copy(src, dst):
+    """Copy onto a Windows drive from WSL by letting cmd.exe do the work natively.
+
+    Returns False without copying if a path cannot be passed safely to cmd.exe.
+    """
+    import subprocess
+    if _CMD_SPECIAL_CHARS.intersection(str(Path(dst).resolve())):
+        return False
+    win_src, win_dst = _wsl_to_windows_path(src), _wsl_to_windows_path(dst)
+    if _CMD_SPECIAL_CHARS.intersection(win_src + win_dst):
+        return False
+    subprocess.run(['cmd.exe', '/c', 'copy', '/Y', win_src, win_dst],
+                   capture_output=True, check=True)
+    return True
+
+
+def _copy_file(src, dst, src_fd=None):
+    """Copy src to dst using the fastest strategy available on this platform."""
+    if sys.platform == 'win32':
+        _windows_copy(src, dst)
+        return
+
+    # Writes to /mnt/<drive> from WSL cross the VM boundary per buffer;
+    # cmd.exe performs the whole copy on the Windows side instead.
+    if _WSL_DRIVE_PATH.match(str(Path(dst).resolve())) and _is_wsl():
+        import subprocess
+        try:
+            if _wsl_windows_copy(src, dst):
+                return
+        except (subprocess.CalledProcessError, OSError):
+            pass
+
+    _fast_copy(src, dst, src_fd)
+
+
+def copy_resume(target_dir, first_name, last_name, source=_RESUME_SRC, source_fd=None):
     """Copy the resume to the target directory with the new name."""
-    source_file = Path("resume.pdf")
+    source_file = source
     target_file = target_dir / f"{first_name}_{last_name}_resume.pdf"
+    # Copy to a hidden temp file and rename it into place so an interrupted
+    # copy never leaves a truncated PDF under the final name.
+    tmp_file = target_dir / f".{target_file.name}.tmp"
     
+    replaced = False
     try:
-        shutil.copy2(source_file, target_file)
+        _copy_file(source_file, tmp_file, source_fd)
+        os.replace(tmp_file, target_file)
+        replaced = True
         print_success(f"Resume copied to: {target_file}")
         return True
     except Exception as e:
         print_error(f"Error copying resume: {e}")
         return False
+    finally:
+        # Also runs on KeyboardInterrupt, so no partial temp file is left behind
+        if not replaced:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
 
 
 def main():
     """Main function to handle resume export."""
     print_header("Resume Export Script")
     
-    # Check if compiled resume exists
-    if not check_resume_exists():
-        sys.exit(1)
+    from concurrent.futures import ThreadPoolExecutor
+    # Open the compiled resume, overlapping the independent .env read
+    # and git lookup with it
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_resume = executor.submit(open_resume)
+        executor.submit(_prefetch_environment)
+        f_branch = executor.submit(get_git_branch)
+        resume_fd = f_resume.result()
+        if resume_fd is None:
+            sys.exit(1)
     
     # Load environment configuration
     try:
@@ -167,23 +428,15 @@ def main():
         print_info("Please ensure .env file exists and contains valid BASE_DIR, FIRST_NAME, and LAST_NAME.")
         sys.exit(1)
     
-    # Check if base directory exists
-    if not OUTPUT_BASE.exists():
-        print_error(f"Base directory does not exist: {OUTPUT_BASE}")
-        print_info("Please check the BASE_DIR path in your .env file and ensure it exists.")
-        sys.exit(1)
-    
     # Prompt for directory name
     print_info(f"Base output directory: {OUTPUT_BASE}")
-    default_name = get_default_directory_name()
+    default_name = get_default_directory_name(f_branch.result())
     print_prompt(f"Enter a subdirectory name (press Enter for '{default_name}'): ")
     user_input = input().strip()
+    dir_name = user_input or default_name
     
     if not user_input:
-        dir_name = get_default_directory_name()
         print_info(f"Using default directory name: {dir_name}")
-    else:
-        dir_name = user_input
     
     # Create the target directory
     target_dir = create_directory(OUTPUT_BASE, dir_name)
@@ -191,7 +444,9 @@ def main():
         sys.exit(1)
     
     # Copy the resume
-    if copy_resume(target_dir, FIRST_NAME, LAST_NAME):
+    copied = copy_resume(target_dir, FIRST_NAME, LAST_NAME, source_fd=resume_fd)
+    os.close(resume_fd)
+    if copied:
         print_success(f"\nResume successfully exported to: {target_dir}")
     else:
         print_error("\nFailed to export resume.")